@@ -28,6 +28,7 @@ class Tracer(GraphBasedContext, RemoteMixin, BridgeMixin, EditMixin):
         _kwargs (Dict[str,Any]): Keyword arguments to be passed to function that executes the model.
         _invoker_inputs (List[Any]): Inputs for each invocation of this Tracer.
         _invoker (Invoker): Currently open Invoker.
+        _envoy (nnsight.envoy.Envoy): Root Envoy of the model.
     """
 
     def __init__(
@@ -43,6 +44,11 @@ class Tracer(GraphBasedContext, RemoteMixin, BridgeMixin, EditMixin):
 
         self.model = model
 
+        # Root Envoy of the model, cached as it's accessed on every forwarded attribute lookup.
+        self._envoy = model._envoy
+
+        self._cached_envoy_keys: List[str] = []
+
         self.return_context = return_context
 
         GraphBasedContext.__init__(
@@ -64,15 +70,27 @@ class Tracer(GraphBasedContext, RemoteMixin, BridgeMixin, EditMixin):
         self._invoker_inputs: List[Any] = []
 
         # Module Envoys need to know about the current Tracer to create the correct proxies.
-        self.model._envoy._set_tracer(weakref.proxy(self))
+        self._envoy._set_tracer(weakref.proxy(self))
 
     def __getattr__(self, key: Any) -> Any:
         """Wrapper of .model._envoy's attributes to access module Envoy inputs and outputs.
 
+        Module Envoys are cached on the Tracer after their first lookup so subsequent accesses don't go through here. Cleared on exit.
+
         Returns:
             Any: Attribute.
         """
-        return getattr(self.model._envoy, key)
+
+        from ..envoy import Envoy
+
+        value = getattr(self._envoy, key)
+
+        if isinstance(value, Envoy):
+
+            self.__dict__[key] = value
+            self._cached_envoy_keys.append(key)
+
+        return value
 
     def __enter__(self) -> Union[Self, "NNsight", Tuple["NNsight", Self]]:
 
@@ -96,8 +114,12 @@ class Tracer(GraphBasedContext, RemoteMixin, BridgeMixin, EditMixin):
 
             self.invoker.__exit__(None, None, None)
 
-        self.model._envoy._reset()
+        self._envoy._reset()
 
+        for key in self._cached_envoy_keys:
+            self.__dict__.pop(key, None)
+
+        self._cached_envoy_keys.clear()
 
         super().__exit__(exc_type, exc_val, exc_tb)
 
@@ -124,7 +146,7 @@ class Tracer(GraphBasedContext, RemoteMixin, BridgeMixin, EditMixin):
             increment (int): How many call_iter to increment at once. Defaults to 1.
         """
 
-        self.model._envoy.next(increment=increment, propagate=True)
+        self._envoy.next(increment=increment, propagate=True)
 
     ##### BACKENDS ###############################
 
@@ -176,9 +198,11 @@ class Tracer(GraphBasedContext, RemoteMixin, BridgeMixin, EditMixin):
 
     def remote_backend_handle_result_value(self, value: Dict[str, Any]) -> None:
 
+        nodes = self.graph.nodes
+
         # TODO : graph mismatch handle. hash json ?
         for node_name, node_value in value.items():
-            self.graph.nodes[node_name]._value = node_value
+            nodes[node_name]._value = node_value
 
     def remote_backend_cleanup(self):
         
@@ -1,12 +1,32 @@
 from __future__ import annotations
 
+import atexit
 import io
-from typing import TYPE_CHECKING, Any, Callable
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import requests
-import socketio
 import torch
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 from ... import CONFIG
 from ...logger import logger, remote_logger
@@ -14,8 +34,241 @@ from .LocalBackend import LocalBackend, LocalMixin
 
 if TYPE_CHECKING:
 
+    import socketio
+
     from ...schema.Request import RequestModel
-    from ...schema.Response import ResponseModel
+    from ...schema.Response import ResponseModel, ResultModel
+
+
+# Headers sent with every request submission. Never mutated, extended by copying.
+_POST_HEADERS = {"Content-Type": "application/json"}
+
+# Prefer a memory backed filesystem for memory mapped results.
+_SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# HTTP sessions keyed by (address, api key), shared by every RemoteBackend so pooled connections outlive a single trace.
+_SESSIONS: Dict[Tuple[str, str], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(address: str, api_key: str) -> requests.Session:
+    """Returns the shared HTTP session for a remote host and api key, creating it on first use.
+
+    Args:
+        address (str): Remote host address.
+        api_key (str): Api key sent with every request.
+
+    Returns:
+        requests.Session: Session.
+    """
+
+    with _SESSIONS_LOCK:
+
+        session = _SESSIONS.get((address, api_key))
+
+        if session is None:
+
+            session = requests.Session()
+
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.2),
+            )
+
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            session.headers.update({"ndif-api-key": api_key})
+
+            _SESSIONS[(address, api_key)] = session
+
+        return session
+
+
+def close_sessions() -> None:
+    """Closes all shared HTTP sessions and their pooled connections. Called at interpreter exit."""
+
+    with _SESSIONS_LOCK:
+
+        for session in _SESSIONS.values():
+            session.close()
+
+        _SESSIONS.clear()
+
+
+atexit.register(close_sessions)
+
+# Shared zstandard compressor for request bodies. Created on first use as it's costly to build.
+_ZSTD_COMPRESSOR = None
+_ZSTD_LOCK = threading.Lock()
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    """Compresses data with the shared zstandard compressor, creating it on first use.
+
+    Compressor instances aren't thread safe so compressing is serialized by a lock. The compressor itself uses all cores.
+
+    Args:
+        data (bytes): Data to compress.
+
+    Returns:
+        bytes: Compressed data.
+    """
+
+    global _ZSTD_COMPRESSOR
+
+    with _ZSTD_LOCK:
+
+        if _ZSTD_COMPRESSOR is None:
+
+            try:
+
+                import zstandard
+
+            except Exception as e:
+
+                raise type(e)(
+                    "CONFIG.API.COMPRESSION = 'zstd' requires `zstandard` to be installed."
+                ) from e
+
+            _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3, threads=-1)
+
+        return _ZSTD_COMPRESSOR.compress(data)
+
+
+# Worker connecting websockets in the background while blocking requests are built. Its thread is only started on first use.
+_CONNECT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Idle websocket clients keyed by websocket address, shared by every RemoteBackend so blocking requests skip the handshake.
+# A blocking request checks a client out for the duration of its job, so two jobs never read from the same socket.
+_SIO_CLIENTS: Dict[str, List[socketio.SimpleClient]] = {}
+_SIO_LOCK = threading.Lock()
+
+
+def _acquire_sio(ws_address: str) -> socketio.SimpleClient:
+    """Checks out an idle websocket client for an address that's still connected, connecting a new one if there is none.
+
+    Args:
+        ws_address (str): Remote host websocket address.
+
+    Returns:
+        socketio.SimpleClient: Connected client.
+    """
+
+    with _SIO_LOCK:
+
+        clients = _SIO_CLIENTS.get(ws_address, [])
+
+        while clients:
+
+            sio = clients.pop()
+
+            if sio.connected:
+                return sio
+
+            _disconnect_sio(sio)
+
+    import socketio
+
+    # Create a socketio connection to the server.
+    sio = socketio.SimpleClient(logger=logger, reconnection_attempts=10)
+
+    # Connect
+    sio.connect(
+        ws_address,
+        socketio_path="/ws/socket.io",
+        transports=["websocket"],
+        wait_timeout=10,
+    )
+
+    return sio
+
+
+def _release_sio(ws_address: str, sio: socketio.SimpleClient) -> None:
+    """Hands back a client from `_acquire_sio` after its job completed, for the next blocking request to re-use.
+
+    Args:
+        ws_address (str): Remote host websocket address.
+        sio (socketio.SimpleClient): Client.
+    """
+
+    with _SIO_LOCK:
+
+        _SIO_CLIENTS.setdefault(ws_address, []).append(sio)
+
+
+def _disconnect_sio(sio: socketio.SimpleClient) -> None:
+    """Disconnects a client, logging instead of raising if that fails.
+
+    Args:
+        sio (socketio.SimpleClient): Client.
+    """
+
+    try:
+
+        sio.disconnect()
+
+    except Exception:
+        # Don't hide an error from the request itself behind one from closing its connection.
+        logger.exception("Failed to disconnect from the remote service websocket.")
+
+
+def close_websockets() -> None:
+    """Disconnects all idle shared websocket clients. Called at interpreter exit."""
+
+    with _SIO_LOCK:
+
+        for clients in _SIO_CLIENTS.values():
+
+            for sio in clients:
+                _disconnect_sio(sio)
+
+        _SIO_CLIENTS.clear()
+
+
+atexit.register(close_websockets)
+
+
+class _BufferReader(io.RawIOBase):
+    """Read-only, seekable file-like view over an in memory buffer that does not copy it."""
+
+    def __init__(self, buffer: memoryview) -> None:
+
+        self.buffer = buffer
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+
+        data = self.buffer[self.position : self.position + len(b)]
+
+        n_bytes = len(data)
+
+        b[:n_bytes] = data
+
+        self.position += n_bytes
+
+        return n_bytes
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        elif whence == io.SEEK_END:
+            self.position = len(self.buffer) + offset
+
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
 
 
 class RemoteMixin(LocalMixin):
@@ -86,6 +339,36 @@ class RemoteBackend(LocalBackend):
         self.address = f"http{'s' if self.ssl else ''}://{self.host}"
         self.ws_address = f"ws{'s' if CONFIG.API.SSL else ''}://{self.host}"
 
+        # Persistent HTTP session so consecutive calls to the remote service re-use the same connection.
+        self._session = _get_session(self.address, self.api_key)
+
+    @contextmanager
+    def _websocket(self) -> Iterator[Future]:
+        """Checks out a shared socketio client for the duration of a blocking request, connecting one in the background if needed.
+
+        The client is handed back for re-use once the request completes. If anything failed, including building the request,
+        it's disconnected and dropped instead so updates from a failed job can't leak into the next request.
+
+        Yields:
+            Future: Future of the connected client. Passed to `.blocking_request` as `sio_future`.
+        """
+
+        future = _CONNECT_EXECUTOR.submit(_acquire_sio, self.ws_address)
+
+        try:
+
+            yield future
+
+        except BaseException:
+
+            # If connecting failed there's nothing to drop.
+            if future.exception() is None:
+                _disconnect_sio(future.result())
+
+            raise
+
+        _release_sio(self.ws_address, future.result())
+
     def request(self, obj: RemoteMixin):
 
         model_key = obj.remote_backend_get_model_key()
@@ -93,7 +376,9 @@ class RemoteBackend(LocalBackend):
         from ...schema.Request import RequestModel
 
         # Create request using pydantic to parse the object itself.
-        return RequestModel(object=obj, model_key=model_key)
+        return RequestModel.create(
+            obj, model_key, dedup_tensors=CONFIG.API.DEDUP_TENSORS
+        )
 
     def __call__(self, obj: RemoteMixin):
 
@@ -101,10 +386,13 @@ class RemoteBackend(LocalBackend):
 
         if self.blocking:
 
-            request = self.request(obj)
+            # Connect to the websocket in the background while the request is built and encoded.
+            with self._websocket() as sio_future:
+
+                request = self.request(obj)
 
-            # Do blocking request.
-            self.blocking_request(request)
+                # Do blocking request.
+                self.blocking_request(request, sio_future=sio_future)
 
         else:
 
@@ -128,7 +416,7 @@ class RemoteBackend(LocalBackend):
         Use the backend object's .handle_result method to handle the decoded result.
 
         Args:
-            data (Any): Json data to concert to `ResponseModel`
+            data (Any): Json data to convert to `ResponseModel`. Either already decoded or raw json bytes/str.
 
         Raises:
             Exception: If the job's status is `ResponseModel.JobStatus.ERROR`
@@ -137,10 +425,14 @@ class RemoteBackend(LocalBackend):
             ResponseModel: ResponseModel.
         """
 
-        from ...schema.Response import ResponseModel, ResultModel
+        from ...schema.Response import ResponseModel
 
         # Load the data into the ResponseModel pydantic class.
-        response = ResponseModel(**data)
+        # Raw json frames are parsed and validated in one pass by pydantic-core.
+        if isinstance(data, (bytes, str)):
+            response = ResponseModel.model_validate_json(data)
+        else:
+            response = ResponseModel(**data)
 
         # Log response for user
         remote_logger.info(str(response))
@@ -148,41 +440,8 @@ class RemoteBackend(LocalBackend):
         # If the status of the response is completed, update the local nodes that the user specified to save.
         # Then disconnect and continue.
         if response.status == ResponseModel.JobStatus.COMPLETED:
-            # Create BytesIO object to store bytes received from server in.
-            result_bytes = io.BytesIO()
-            result_bytes.seek(0)
 
-            # Get result from result url using job id.
-            with requests.get(
-                url=f"{self.address}/result/{response.id}",
-                stream=True,
-            ) as stream:
-                # Total size of incoming data.
-                total_size = float(stream.headers["Content-length"])
-
-                with tqdm(
-                    total=total_size,
-                    unit="B",
-                    unit_scale=True,
-                    desc="Downloading result",
-                ) as progress_bar:
-                    # chunk_size=None so server determines chunk size.
-                    for data in stream.iter_content(chunk_size=None):
-                        progress_bar.update(len(data))
-                        result_bytes.write(data)
-
-            # Move cursor to beginning of bytes.
-            result_bytes.seek(0)
-
-            # Decode bytes with pickle and then into pydantic object.
-            result: "ResultModel" = ResultModel(
-                **torch.load(
-                    result_bytes, map_location="cpu", weights_only=False
-                )
-            )
-
-            # Close bytes
-            result_bytes.close()
+            result = self.get_result(response.id)
 
             # Handle result
             self.handle_result(result.value)
@@ -193,6 +452,434 @@ class RemoteBackend(LocalBackend):
 
         return response
 
+    def get_result(self, id: str) -> "ResultModel":
+        """Streams the result of a completed job from the remote endpoint and decodes it.
+
+        Bytes are read directly into a single pre-allocated buffer which torch.load then reads from in place,
+        so only one copy of the payload is held in memory while decoding.
+        If CONFIG.API.MMAP_RESULTS is set, the buffer is instead a memory mapped temporary file (on /dev/shm if available)
+        which is loaded with `mmap=True` so tensors are views over the mapped file rather than copies.
+        If CONFIG.API.PARALLEL_DOWNLOADS > 1 and a one byte probe shows the server honors byte ranges,
+        the buffer is filled over that many connections before ever requesting the whole body.
+        Bodies sent with a Content-Encoding are instead decoded into a growing buffer as their decoded size isn't known up front.
+        If the server encoded the result with safetensors (`format` header), it is decoded without pickle.
+
+        Args:
+            id (str): Id of the completed job.
+
+        Returns:
+            ResultModel: Result.
+        """
+
+        url = f"{self.address}/result/{id}"
+
+        # Split the download over multiple connections if enabled and the server supports byte ranges.
+        probe = (
+            self._probe_ranges(url) if CONFIG.API.PARALLEL_DOWNLOADS > 1 else None
+        )
+
+        if probe is not None:
+
+            total_size, format = probe
+
+            with self._result_buffer(total_size) as (view, path):
+
+                with self._progress_bar(total_size) as progress_bar:
+
+                    downloaded = self._download_ranges(url, view, progress_bar)
+
+                if downloaded:
+
+                    if path is None:
+                        return self._load_result(id, format, view)
+
+                    return self._load_result_file(id, format, path)
+
+        # Otherwise, or if a range wasn't honored, get the result in one stream.
+        with self._session.get(url=url, stream=True) as stream:
+            # Total size of incoming data.
+            total_size = int(stream.headers["Content-length"])
+            # How the result was encoded by the server.
+            format = stream.headers.get("format", "pt")
+
+            # Content-length is the size of the encoded body, so the decoded size is only known once it's all read.
+            if stream.headers.get("Content-Encoding", "identity") != "identity":
+
+                with self._progress_bar(total_size) as progress_bar:
+
+                    data = self._download_encoded(stream, progress_bar)
+
+                stream.close()
+
+                return self._load_result(id, format, memoryview(data))
+
+            with self._result_buffer(total_size) as (view, path):
+
+                with self._progress_bar(total_size) as progress_bar:
+
+                    offset = self._download_stream(stream, view, progress_bar)
+
+                stream.close()
+
+                if offset < total_size:
+                    raise Exception(
+                        f"Result download ended after {offset} of {total_size} bytes."
+                    )
+
+                if path is None:
+                    return self._load_result(id, format, view)
+
+                return self._load_result_file(id, format, path)
+
+    def _progress_bar(self, total_size: int) -> tqdm:
+        """Creates the progress bar shown while downloading a result of total_size bytes."""
+
+        return tqdm(
+            total=total_size,
+            unit="B",
+            unit_scale=True,
+            desc="Downloading result",
+        )
+
+    @contextmanager
+    def _result_buffer(
+        self, total_size: int
+    ) -> Iterator[Tuple[memoryview, Optional[str]]]:
+        """Allocates a buffer to download a result into.
+
+        If CONFIG.API.MMAP_RESULTS is set, the buffer is a memory mapped temporary file (on /dev/shm if available)
+        and its path is yielded alongside it. Otherwise it's a bytearray and the path is None.
+        Memory mapping is only used where the file's space can be reserved up front with `os.posix_fallocate`,
+        falling back to a bytearray if it can't.
+        The temporary file is always removed on exit, whether or not the download and decoding succeeded.
+
+        Args:
+            total_size (int): Size of the buffer in bytes.
+
+        Yields:
+            Tuple[memoryview, Optional[str]]: View over the buffer and the path of its file if memory mapped.
+        """
+
+        file = None
+
+        if (
+            CONFIG.API.MMAP_RESULTS
+            and total_size > 0
+            and hasattr(os, "posix_fallocate")
+        ):
+
+            file = self._reserve_result_file(total_size)
+
+        if file is None:
+
+            yield memoryview(bytearray(total_size)), None
+
+            return
+
+        try:
+
+            buffer = mmap.mmap(file.fileno(), total_size)
+            view = memoryview(buffer)
+
+            try:
+
+                yield view, file.name
+
+            finally:
+
+                try:
+
+                    view.release()
+                    buffer.close()
+
+                except BufferError:
+                    # A slice of the view is still referenced. The mapping is closed once it's collected.
+                    pass
+
+        finally:
+
+            file.close()
+
+            # Mapped tensors keep their pages after the file is unlinked.
+            os.unlink(file.name)
+
+    def _reserve_result_file(self, total_size: int) -> Optional[IO[bytes]]:
+        """Creates a temporary file to memory map a result into, reserving its space.
+
+        A file that's only truncated to size is sparse. Writing into its mapping once the filesystem is full
+        (like a small /dev/shm in a container) raises SIGBUS and kills the process, where reserving raises ENOSPC.
+
+        Args:
+            total_size (int): Size of the result in bytes.
+
+        Returns:
+            Optional[IO[bytes]]: The file, or None if its space couldn't be reserved.
+        """
+
+        file = tempfile.NamedTemporaryFile(dir=_SHM_DIR, suffix=".result", delete=False)
+
+        reserved = False
+
+        try:
+
+            os.posix_fallocate(file.fileno(), 0, total_size)
+
+            reserved = True
+
+        except OSError as e:
+
+            logger.warning(
+                f"Couldn't reserve {total_size} bytes to memory map the result ({e}). Downloading it into memory instead."
+            )
+
+        finally:
+
+            if not reserved:
+
+                file.close()
+                os.unlink(file.name)
+
+        return file if reserved else None
+
+    def _load_result(self, id: str, format: str, data: memoryview) -> "ResultModel":
+        """Decodes a downloaded result held in memory.
+
+        Args:
+            id (str): Id of the completed job.
+            format (str): Encoding of the result. Either "safetensors" or "pt".
+            data (memoryview): Result bytes.
+
+        Returns:
+            ResultModel: Result.
+        """
+
+        from ...schema.Response import ResultModel
+
+        # Results made up of only tensors can be sent as safetensors, which skips unpickling.
+        if format == "safetensors":
+
+            return ResultModel(id=id, value=ResultModel.from_safetensors(data))
+
+        # Otherwise decode bytes with pickle and then into pydantic object.
+        return ResultModel(
+            **torch.load(
+                _BufferReader(data),
+                map_location="cpu",
+                weights_only=False,
+            )
+        )
+
+    def _load_result_file(self, id: str, format: str, path: str) -> "ResultModel":
+        """Decodes a downloaded result from a file, memory mapping its tensors.
+
+        Tries loading with `weights_only=True` first and only falls back to the full unpickler
+        if the result contains objects other than tensors and primitive containers.
+
+        Args:
+            id (str): Id of the completed job.
+            format (str): Encoding of the result. Either "safetensors" or "pt".
+            path (str): Path to the result file.
+
+        Returns:
+            ResultModel: Result.
+        """
+
+        from ...schema.Response import ResultModel
+
+        if format == "safetensors":
+
+            return ResultModel(id=id, value=ResultModel.from_safetensors_file(path))
+
+        try:
+
+            result = torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+
+        except pickle.UnpicklingError:
+
+            result = torch.load(path, map_location="cpu", mmap=True, weights_only=False)
+
+        return ResultModel(**result)
+
+    def _download_stream(
+        self, stream: requests.Response, view: memoryview, progress_bar: tqdm
+    ) -> int:
+        """Reads a streamed response into a buffer.
+
+        Args:
+            stream (requests.Response): Streamed response.
+            view (memoryview): Buffer to read into.
+            progress_bar (tqdm): Progress bar to update.
+
+        Returns:
+            int: Number of bytes read.
+        """
+
+        # Only used for identity encoded bodies, so raw bytes are the result's bytes.
+        chunk_size = CONFIG.API.DOWNLOAD_CHUNK
+        total_size = len(view)
+        offset = 0
+
+        while offset < total_size:
+            n_bytes = stream.raw.readinto(view[offset : offset + chunk_size])
+
+            if not n_bytes:
+                break
+
+            offset += n_bytes
+            progress_bar.update(n_bytes)
+
+        return offset
+
+    def _download_encoded(
+        self, stream: requests.Response, progress_bar: tqdm
+    ) -> bytearray:
+        """Reads and decodes a streamed response with a Content-Encoding into a growing buffer.
+
+        Args:
+            stream (requests.Response): Streamed response.
+            progress_bar (tqdm): Progress bar to update.
+
+        Returns:
+            bytearray: Decoded bytes.
+        """
+
+        data = bytearray()
+
+        for chunk in stream.iter_content(chunk_size=CONFIG.API.DOWNLOAD_CHUNK):
+
+            data += chunk
+
+            # Track progress in encoded bytes read off the wire to match Content-length.
+            progress_bar.update(stream.raw.tell() - progress_bar.n)
+
+        return data
+
+    def _probe_ranges(self, url: str) -> Optional[Tuple[int, str]]:
+        """Checks if the server honors byte range requests for a result by requesting only its first byte.
+
+        Args:
+            url (str): Result url.
+
+        Returns:
+            Optional[Tuple[int, str]]: Total size and format of the result, or None if it can't be downloaded in ranges.
+        """
+
+        with self._session.get(
+            url=url, headers={"Range": "bytes=0-0"}, stream=True
+        ) as stream:
+
+            # Content-Range is of the form "bytes 0-0/<total size>".
+            total_size = stream.headers.get("Content-Range", "").rpartition("/")[2]
+
+            if (
+                stream.status_code != 206
+                or not total_size.isdigit()
+                or stream.headers.get("Content-Encoding", "identity") != "identity"
+            ):
+                return None
+
+            return int(total_size), stream.headers.get("format", "pt")
+
+    def _download_ranges(
+        self, url: str, view: memoryview, progress_bar: tqdm
+    ) -> bool:
+        """Downloads a result into a buffer using CONFIG.API.PARALLEL_DOWNLOADS concurrent range requests.
+
+        Args:
+            url (str): Result url.
+            view (memoryview): Buffer to read into. Each request fills its own slice.
+            progress_bar (tqdm): Progress bar to update.
+
+        Returns:
+            bool: If all ranges were downloaded. False if the server did not honor a range request.
+        """
+
+        chunk_size = CONFIG.API.DOWNLOAD_CHUNK
+        total_size = len(view)
+        n_parts = CONFIG.API.PARALLEL_DOWNLOADS
+        part_size = -(-total_size // n_parts)
+
+        lock = threading.Lock()
+
+        def download(start: int) -> bool:
+
+            end = min(start + part_size, total_size)
+
+            with self._session.get(
+                url=url,
+                headers={"Range": f"bytes={start}-{end - 1}"},
+                stream=True,
+            ) as stream:
+
+                # Server sent back the whole thing instead of the range.
+                if stream.status_code != 206:
+                    return False
+
+                offset = start
+
+                while offset < end:
+                    n_bytes = stream.raw.readinto(
+                        view[offset : min(offset + chunk_size, end)]
+                    )
+
+                    if not n_bytes:
+                        return False
+
+                    offset += n_bytes
+
+                    with lock:
+                        progress_bar.update(n_bytes)
+
+            return True
+
+        with ThreadPoolExecutor(max_workers=n_parts) as executor:
+
+            return all(executor.map(download, range(0, total_size, part_size)))
+
+    def serialize(self, request: "RequestModel") -> Tuple[bytes, Dict[str, str]]:
+        """Encodes a request to be sent to the remote service.
+
+        Pydantic encodes the request straight to json bytes instead of dumping it to a dictionary which is then re-encoded by `json`.
+        The encoded request is compressed if CONFIG.API.COMPRESSION is set to "zstd" or "zlib".
+        If the request has de-duplicated tensors, the "dedup" header is set.
+
+        Args:
+            request (RequestModel): Request.
+
+        Returns:
+            Tuple[bytes, Dict[str, str]]: Encoded request and headers describing it.
+        """
+
+        data = request.model_dump_json(exclude={"id", "received"}).encode()
+
+        headers = _POST_HEADERS
+
+        compression = CONFIG.API.COMPRESSION
+
+        if compression == "zstd":
+
+            data = _zstd_compress(data)
+
+        elif compression == "zlib":
+
+            data = zlib.compress(data)
+
+        # Lets the server reject requests referencing shared tensors it doesn't know how to resolve.
+        if request.tensors is not None:
+
+            headers = {**headers, "dedup": "1"}
+
+        if compression is not None:
+
+            # Compressed bodies are no longer json.
+            headers = {
+                **headers,
+                "Content-Type": "application/octet-stream",
+                "compression": compression,
+            }
+
+        return data, headers
+
     def submit_request(self, request: "RequestModel") -> "ResponseModel":
         """Sends request to the remote endpoint and handles the response object.
 
@@ -203,15 +890,17 @@ class RemoteBackend(LocalBackend):
             (ResponseModel): Response.
         """
 
-        response = requests.post(
+        data, headers = self.serialize(request)
+
+        response = self._session.post(
             f"{self.address}/request",
-            json=request.model_dump(exclude=["id", "received"]),
-            headers={"ndif-api-key": self.api_key},
+            data=data,
+            headers=headers,
         )
 
         if response.status_code == 200:
 
-            return self.handle_response(response.json())
+            return self.handle_response(response.content)
 
         else:
 
@@ -227,53 +916,55 @@ class RemoteBackend(LocalBackend):
             (ResponseModel): Response.
         """
 
-        response = requests.get(
+        response = self._session.get(
             f"{self.address}/response/{self.job_id}",
-            headers={"ndif-api-key": self.api_key},
         )
 
         if response.status_code == 200:
 
-            return self.handle_response(response.json())
+            return self.handle_response(response.content)
 
         else:
 
             raise Exception(response.reason)
 
-    def blocking_request(self, request: "RequestModel"):
+    def blocking_request(
+        self, request: "RequestModel", sio_future: Optional[Future] = None
+    ):
         """Send intervention request to the remote service while waiting for updates via websocket.
 
         Args:
             request (RequestModel): Request.
+            sio_future (Optional[Future]): Future of a socketio client checked out by `._websocket`. Checked out for just this request if None. Defaults to None.
         """
 
+        if sio_future is None:
+
+            with self._websocket() as sio_future:
+
+                return self.blocking_request(request, sio_future=sio_future)
+
         from ...schema.Response import ResponseModel
 
-        # Create a socketio connection to the server.
-        with socketio.SimpleClient(
-            logger=logger, reconnection_attempts=10
-        ) as sio:
-            # Connect
-            sio.connect(
-                self.ws_address,
-                socketio_path="/ws/socket.io",
-                transports=["websocket"],
-                wait_timeout=10,
-            )
+        # Encode the request's object up front so only the session id is left to add once connected.
+        if not isinstance(request.object, str):
+            request.object = request.object.model_dump_json()
 
-            # Give request session ID so server knows to respond via websockets to us.
-            request.session_id = sio.sid
+        sio = sio_future.result()
 
-            # Submit request via
-            self.submit_request(request)
+        # Give request session ID so server knows to respond via websockets to us.
+        request.session_id = sio.sid
 
-            # Loop until
-            while True:
-                if (
-                    self.handle_response(sio.receive()[1]).status
-                    == ResponseModel.JobStatus.COMPLETED
-                ):
-                    break
+        # Submit request via
+        self.submit_request(request)
+
+        # Loop until
+        while True:
+            if (
+                self.handle_response(sio.receive()[1]).status
+                == ResponseModel.JobStatus.COMPLETED
+            ):
+                break
 
     def non_blocking_request(self, request: "RequestModel" = None):
         """Send intervention request to the remote service if request provided. Otherwise get job status.
@@ -293,9 +984,7 @@ class RemoteBackend(LocalBackend):
             # Submit request via
             response = self.submit_request(request)
 
-            CONFIG.API.JOB_ID = response.id
-
-            CONFIG.save()
+            self._set_job_id(response.id)
 
         else:
 
@@ -305,14 +994,24 @@ class RemoteBackend(LocalBackend):
 
                 if response.status == ResponseModel.JobStatus.COMPLETED:
 
-                    CONFIG.API.JOB_ID = None
-
-                    CONFIG.save()
+                    self._set_job_id(None)
 
             except Exception as e:
 
-                CONFIG.API.JOB_ID = None
-
-                CONFIG.save()
+                self._set_job_id(None)
 
                 raise e
+
+    def _set_job_id(self, job_id: Optional[str]) -> None:
+        """Sets CONFIG.API.JOB_ID, only writing the config to disk if the value changed.
+
+        Args:
+            job_id (Optional[str]): Job id or None to clear it.
+        """
+
+        if CONFIG.API.JOB_ID == job_id:
+            return
+
+        CONFIG.API.JOB_ID = job_id
+
+        CONFIG.save()
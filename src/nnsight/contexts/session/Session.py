@@ -135,8 +135,10 @@ class Session(GraphBasedContext, RemoteMixin):
 
             graph = self.bridge.id_to_graph[graph_id]
 
+            nodes = graph.nodes
+
             for node_name, node_value in saves.items():
-                graph.nodes[node_name]._value = node_value
+                nodes[node_name]._value = node_value
 
             graph.alive = False
 
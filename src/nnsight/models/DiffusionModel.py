@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import torch
 from diffusers import DiffusionPipeline
@@ -56,11 +56,14 @@ class DiffusionModel(GenerationMixin, NNsight):
 
     def _prepare_inputs(
         self,
-        inputs: Union[str, List[str]],
+        inputs: Union[str, Iterable[str]],
     ) -> Any:
 
         if isinstance(inputs, str):
             inputs = [inputs]
+        # Pipelines only accept lists of prompts. Lists are passed through without copying.
+        elif not isinstance(inputs, list):
+            inputs = list(inputs)
 
         return (inputs,), len(inputs)
 
@@ -72,9 +75,12 @@ class DiffusionModel(GenerationMixin, NNsight):
 
         if batched_inputs is None:
 
-            return (prepared_inputs, )
+            # Copy so extending doesn't modify the caller's list of prompts.
+            return (list(prepared_inputs), )
 
-        return (batched_inputs + prepared_inputs, )
+        batched_inputs[0].extend(prepared_inputs)
+
+        return batched_inputs
 
     def _execute_forward(self, prepared_inputs: Any, *args, **kwargs):
 
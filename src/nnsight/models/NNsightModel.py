@@ -439,22 +439,25 @@ class NNsight:
         logger.info(f"Running `{self._model_key}`...")
 
         # We need to pre-process and batch all inputs as (inputs) is a list of each set of inputs from each invocation.
-        batch_groups = []
+        prepare_inputs = self._prepare_inputs
+        batch_inputs = self._batch_inputs
+
+        batch_groups = [None] * len(inputs)
         batch_start = 0
         batched_input = None
         batch_size = 0
 
-        for _inputs in inputs:
+        for i, _inputs in enumerate(inputs):
 
-            _inputs, batch_size = self._prepare_inputs(*_inputs)
+            _inputs, batch_size = prepare_inputs(*_inputs)
 
-            batch_groups.append((batch_start, batch_size))
+            batch_groups[i] = (batch_start, batch_size)
             batch_start += batch_size
 
-            batched_input = self._batch_inputs(batched_input, *_inputs)
+            batched_input = batch_inputs(batched_input, *_inputs)
 
         if len(inputs) > 0:
-            inputs, batch_size = self._prepare_inputs(*batched_input)
+            inputs, batch_size = prepare_inputs(*batched_input)
 
         intervention_handler = InterventionHandler(
             intervention_graph, batch_groups, batch_size
@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Literal, Optional
 
 import yaml
 from pydantic import BaseModel
@@ -9,6 +9,11 @@ class ApiConfigModel(BaseModel):
     SSL: bool = True
     APIKEY: Optional[str] = None
     JOB_ID:Optional[str] = None
+    DOWNLOAD_CHUNK: int = 128 * 1024
+    PARALLEL_DOWNLOADS: int = 1
+    MMAP_RESULTS: bool = False
+    DEDUP_TENSORS: bool = False
+    COMPRESSION: Optional[Literal["zstd", "zlib"]] = None
 
 
 class AppConfigModel(BaseModel):
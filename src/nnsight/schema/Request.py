@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING, Dict, List, Union
 
@@ -29,6 +28,8 @@ class RequestModel(BaseModel):
 
     session_id: Optional[str] = None
 
+    tensors: Optional[Dict[int, TensorModel]] = None
+
     @field_serializer("object")
     def serialize_object(
         self, object: Union[SessionType, TracerType, SessionModel, TracerModel]
@@ -39,12 +40,76 @@ class RequestModel(BaseModel):
 
         return object.model_dump_json()
 
+    @classmethod
+    def create(
+        cls, object: "RemoteMixin", model_key: str, dedup_tensors: bool = False
+    ) -> RequestModel:
+        """Creates a request for an object.
+
+        Args:
+            object (RemoteMixin): Object to execute remotely.
+            model_key (str): Model key of the model to execute on.
+            dedup_tensors (bool): If to encode tensors referenced multiple times only once, in `.tensors`.
+                Tensors referenced once are still encoded in place and `.tensors` is left None if no tensor is shared,
+                so the request is the same as without de-duplication. Defaults to False.
+
+        Returns:
+            RequestModel: Request.
+        """
+
+        if not dedup_tensors:
+            return cls(object=object, model_key=model_key)
+
+        table = {}
+
+        token = TENSOR_TABLE.set(table)
+
+        try:
+            request = cls(object=object, model_key=model_key)
+        finally:
+            TENSOR_TABLE.reset(token)
+
+        tensors = {}
+
+        for index, (tensor, references) in enumerate(table.values()):
+
+            model = TensorModel.from_tensor(tensor)
+
+            if len(references) == 1:
+
+                references[0].tensor = model
+
+            else:
+
+                tensors[index] = model
+
+                for reference in references:
+                    reference.id = index
+
+        request.tensors = tensors or None
+
+        return request
+
     def deserialize(self, model: NNsight) -> "RemoteMixin":
 
         handler = DeserializeHandler(model=model)
 
-        object = TypeAdapter(
-            OBJECT_TYPES, config=RequestModel.model_config
-        ).validate_python(json.loads(self.object))
+        if self.tensors is not None:
+
+            handler.tensors = {
+                index: tensor.deserialize(handler)
+                for index, tensor in self.tensors.items()
+            }
+
+        # Parse and validate json in one pass with pydantic-core instead of json.loads + validate_python.
+        if isinstance(self.object, (str, bytes)):
+            object = OBJECT_ADAPTER.validate_json(self.object)
+        # Object was never encoded (request created in this process).
+        else:
+            object = OBJECT_ADAPTER.validate_python(self.object)
 
         return object.deserialize(handler)
+
+
+# Building the validator is expensive so only do it once instead of per request.
+OBJECT_ADAPTER = TypeAdapter(OBJECT_TYPES, config=RequestModel.model_config)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 from datetime import datetime
 from enum import Enum
@@ -11,6 +12,26 @@ from pydantic import BaseModel
 from .. import util
 from ..tracing.Graph import Graph
 
+# safetensors dtype names to torch dtypes, for decoding tensors straight out of a buffer.
+_SAFETENSORS_DTYPES = {
+    name: getattr(torch, dtype)
+    for name, dtype in {
+        "F64": "float64",
+        "F32": "float32",
+        "F16": "float16",
+        "BF16": "bfloat16",
+        "F8_E4M3": "float8_e4m3fn",
+        "F8_E5M2": "float8_e5m2",
+        "I64": "int64",
+        "I32": "int32",
+        "I16": "int16",
+        "I8": "int8",
+        "U8": "uint8",
+        "BOOL": "bool",
+    }.items()
+    if hasattr(torch, dtype)
+}
+
 
 class ResultModel(BaseModel):
     id: str
@@ -26,7 +47,157 @@ class ResultModel(BaseModel):
         }
 
         return saves
- 
+
+    @staticmethod
+    def to_safetensors(value: Dict[Any, Any]) -> Optional[bytes]:
+        """Encodes a result value with safetensors, avoiding pickle on both ends.
+
+        Only possible when every leaf of the (possibly nested) result dictionary is a tensor.
+        Each tensor is keyed by the json encoded path of keys leading to it so the structure can be rebuilt.
+        Paths to empty dictionaries are stored in the metadata so they aren't lost.
+
+        Args:
+            value (Dict[Any, Any]): Result value. Either saves from `.from_graph` or a dictionary of them.
+
+        Returns:
+            Optional[bytes]: Encoded bytes or None if the result contains non-tensor values or tensors sharing memory.
+        """
+
+        from safetensors.torch import save
+
+        tensors = {}
+        empty = []
+        # safetensors refuses tensors that share memory, like a save and a slice of it. Pickle keeps the sharing instead.
+        storages = set()
+
+        def flatten(value: Dict[Any, Any], path: List[Any]) -> bool:
+
+            if not value:
+                empty.append(path)
+
+            for key, item in value.items():
+
+                if isinstance(item, dict):
+
+                    if not flatten(item, path + [key]):
+                        return False
+
+                elif isinstance(item, torch.Tensor):
+
+                    item = item.contiguous()
+
+                    storage = item.untyped_storage()
+
+                    if storage.nbytes() > 0:
+
+                        if storage.data_ptr() in storages:
+                            return False
+
+                        storages.add(storage.data_ptr())
+
+                    tensors[json.dumps(path + [key])] = item
+
+                else:
+
+                    return False
+
+            return True
+
+        if not flatten(value, []):
+            return None
+
+        return save(tensors, metadata={"empty": json.dumps(empty)})
+
+    @staticmethod
+    def from_safetensors(data: Union[bytes, bytearray, memoryview]) -> Dict[Any, Any]:
+        """Decodes a result value encoded with `.to_safetensors`.
+
+        Tensors are created directly over the given buffer instead of being copied out of it,
+        so the buffer must not be modified afterwards.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]): Encoded bytes.
+
+        Returns:
+            Dict[Any, Any]: Result value.
+        """
+
+        data = memoryview(data)
+
+        # Little endian u64 header size followed by the json header and then the tensor data.
+        header_size = int.from_bytes(data[:8], "little")
+        header = json.loads(bytes(data[8 : 8 + header_size]))
+        metadata = header.pop("__metadata__", None) or {}
+
+        start = 8 + header_size
+
+        tensors = {}
+
+        for key, info in header.items():
+
+            dtype = _SAFETENSORS_DTYPES[info["dtype"]]
+            begin, end = info["data_offsets"]
+
+            if begin == end:
+
+                tensors[key] = torch.empty(info["shape"], dtype=dtype)
+
+            else:
+
+                tensors[key] = torch.frombuffer(
+                    data[start + begin : start + end], dtype=dtype
+                ).reshape(info["shape"])
+
+        return ResultModel._unflatten_safetensors(tensors, metadata)
+
+    @staticmethod
+    def from_safetensors_file(path: str) -> Dict[Any, Any]:
+        """Decodes a result value encoded with `.to_safetensors` from a file, memory mapping its tensors.
+
+        Args:
+            path (str): Path to the encoded file.
+
+        Returns:
+            Dict[Any, Any]: Result value.
+        """
+
+        from safetensors import safe_open
+
+        with safe_open(path, framework="pt") as file:
+
+            tensors = {key: file.get_tensor(key) for key in file.keys()}
+
+            metadata = file.metadata() or {}
+
+        return ResultModel._unflatten_safetensors(tensors, metadata)
+
+    @staticmethod
+    def _unflatten_safetensors(
+        tensors: Dict[str, torch.Tensor], metadata: Dict[str, str]
+    ) -> Dict[Any, Any]:
+
+        value = {}
+
+        for path in json.loads(metadata.get("empty", "[]")):
+
+            saves = value
+
+            for step in path:
+                saves = saves.setdefault(step, {})
+
+        for key, tensor in tensors.items():
+
+            *path, name = json.loads(key)
+
+            saves = value
+
+            for step in path:
+                saves = saves.setdefault(step, {})
+
+            saves[name] = tensor
+
+        return value
+
 
 class ResponseModel(BaseModel):
     class JobStatus(Enum):
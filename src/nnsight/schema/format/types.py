@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import weakref
+from contextvars import ContextVar
 from types import BuiltinFunctionType
 from types import FunctionType as FuncType
 from types import MethodDescriptorType
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import torch
 from pydantic import (BaseModel, ConfigDict, Field, Strict, field_validator,
@@ -31,12 +32,14 @@ class DeserializeHandler:
         nodes: Dict[str, Union[NodeModel, NodeType]] = None,
         model: NNsight = None,
         bridge: Bridge = None,
+        tensors: Dict[int, torch.Tensor] = None,
     ) -> None:
 
         self.graph = graph
         self.nodes = nodes
         self.model = model
         self.bridge = bridge
+        self.tensors = tensors
 
 
 FUNCTION = Union[BuiltinFunctionType, FuncType, MethodDescriptorType, type]
@@ -132,9 +135,37 @@ class TensorModel(BaseNNsightModel):
 
     type_name: Literal["TENSOR"] = "TENSOR"
 
+    class Reference(BaseNNsightModel):
+        type_name: Literal["TENSOR_REFERENCE"] = "TENSOR_REFERENCE"
+
+        ### Index into the request's tensors if the tensor is used more than once.
+        id: Optional[int] = None
+        ### Otherwise the tensor itself, encoded in place.
+        tensor: Optional[TensorModel] = None
+
+        @model_serializer(mode="wrap")
+        def serialize_model(self, handler):
+
+            # Tensors used once are encoded as a plain TensorModel, the same as without de-duplication.
+            if self.tensor is not None:
+                return self.tensor.model_dump()
+
+            return handler(self)
+
+        def deserialize(self, handler: DeserializeHandler) -> torch.Tensor:
+
+            if self.tensor is not None:
+                return self.tensor.deserialize(handler)
+
+            return handler.tensors[self.id]
+
     values: List
     dtype: str
 
+    @classmethod
+    def from_tensor(cls, value: torch.Tensor) -> TensorModel:
+        return cls(values=value.tolist(), dtype=str(value.dtype).split(".")[-1])
+
     def deserialize(self, handler: DeserializeHandler) -> torch.Tensor:
         dtype = getattr(torch, self.dtype)
         return torch.tensor(self.values, dtype=dtype)
@@ -347,14 +378,31 @@ GraphType = Annotated[
     ),
 ]
 
-TensorType = Annotated[
-    torch.Tensor,
-    AfterValidator(
-        lambda value: TensorModel(
-            values=value.tolist(), dtype=str(value.dtype).split(".")[-1]
-        )
-    ),
-]
+### While set, tensors are collected here (id(tensor) -> (tensor, references to it)) and replaced by references
+### which are filled in once all uses of each tensor are known.
+TENSOR_TABLE: ContextVar[
+    Optional[Dict[int, Tuple[torch.Tensor, List[TensorModel.Reference]]]]
+] = ContextVar("TENSOR_TABLE", default=None)
+
+
+def tensor_to_model(value: torch.Tensor) -> Union[TensorModel, TensorModel.Reference]:
+
+    table = TENSOR_TABLE.get()
+
+    if table is None:
+        return TensorModel.from_tensor(value)
+
+    # Keep a reference to the tensor so its id can't be re-used while collecting.
+    _, references = table.setdefault(id(value), (value, []))
+
+    reference = TensorModel.Reference()
+
+    references.append(reference)
+
+    return reference
+
+
+TensorType = Annotated[torch.Tensor, AfterValidator(tensor_to_model)]
 
 SliceType = Annotated[
     slice,
@@ -428,6 +476,7 @@ TOTYPES = Union[
     NodeModel.Reference,
     SliceModel,
     TensorModel,
+    TensorModel.Reference,
     TupleModel,
     ListModel,
     DictModel,
@@ -46,6 +46,23 @@ class Node:
         value (Any): Actual value to be populated during execution.
     """
 
+    __slots__ = (
+        "graph",
+        "proxy_value",
+        "target",
+        "args",
+        "kwargs",
+        "proxy",
+        "_value",
+        "listeners",
+        "arg_dependencies",
+        "cond_dependency",
+        "remaining_listeners",
+        "remaining_dependencies",
+        "name",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         target: Union[Callable, str],
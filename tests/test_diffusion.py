@@ -0,0 +1,24 @@
+from nnsight.models.DiffusionModel import DiffusionModel
+
+
+def test_batch_inputs():
+    # Batching doesn't touch the underlying pipeline, so no need to load one.
+    model = DiffusionModel.__new__(DiffusionModel)
+
+    prompts = ["A cat", "A dog"]
+    invocations = [(prompts,), ("A bird",)]
+
+    batched_inputs = None
+
+    for inputs in invocations:
+        inputs, batch_size = model._prepare_inputs(*inputs)
+
+        batched_inputs = model._batch_inputs(batched_inputs, *inputs)
+
+    inputs, batch_size = model._prepare_inputs(*batched_inputs)
+
+    assert inputs == (["A cat", "A dog", "A bird"],)
+    assert batch_size == 3
+
+    # Extending the batch must not modify the caller's list of prompts.
+    assert prompts == ["A cat", "A dog"]
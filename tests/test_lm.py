@@ -2,6 +2,7 @@ import pytest
 import torch
 
 import nnsight
+from nnsight import util
 from nnsight.contexts.GraphBasedContext import GlobalTracingContext
 from nnsight.contexts.Tracer import Tracer
 from nnsight.schema.Request import RequestModel
@@ -34,6 +35,43 @@ def _test_serialize(tracer: Tracer):
     assert isinstance(tracer.graph, Graph)
 
 
+def _graph_tensors(graph: Graph):
+    tensors = []
+
+    for node in graph.nodes.values():
+        util.apply((node.args, node.kwargs), tensors.append, torch.Tensor)
+
+    return tensors
+
+
+def _test_serialize_dedup(tracer: Tracer, n_shared: int):
+    with GlobalTracingContext.exit_global_tracing_context():
+        request = RequestModel.create(
+            tracer, tracer.remote_backend_get_model_key(), dedup_tensors=True
+        )
+        request_json = request.model_dump(
+            mode="json", exclude=["session_id", "received", "id"]
+        )
+
+        request2 = RequestModel(**request_json)
+        tracer2 = request2.deserialize(tracer.model)
+    assert isinstance(tracer2.graph, Graph)
+
+    # Only tensors used more than once are moved out of the graph.
+    assert len(request2.tensors or {}) == n_shared
+
+    tensors = _graph_tensors(tracer.graph)
+    tensors2 = _graph_tensors(tracer2.graph)
+
+    assert len(tensors) == len(tensors2)
+
+    for tensor, tensor2 in zip(tensors, tensors2):
+        assert tensor.dtype == tensor2.dtype
+        assert torch.equal(tensor.cpu(), tensor2)
+
+    return tensors2
+
+
 @torch.no_grad()
 def test_generation(gpt2: nnsight.LanguageModel, MSG_prompt: str):
     with gpt2.generate(max_new_tokens=3, validate=True) as generator:
@@ -110,6 +148,46 @@ def test_set2(gpt2: nnsight.LanguageModel, MSG_prompt: str):
     assert output != "Madison Square Garden is located in the city of New"
 
 
+@torch.no_grad()
+def test_serialize_dedup(gpt2: nnsight.LanguageModel, MSG_prompt: str):
+    shared = torch.rand(gpt2.config.n_embd)
+    single = torch.rand(gpt2.config.n_embd)
+
+    with gpt2.trace(MSG_prompt, validate=True, scan=True) as tracer:
+        gpt2.transformer.h[0].output[0][:] = shared
+        gpt2.transformer.h[1].output[0][:] = shared
+        gpt2.transformer.h[2].output[0][:] = single
+
+        output = gpt2.transformer.h[2].output[0].save()
+
+        tensors = _test_serialize_dedup(tracer, n_shared=1)
+
+    # The shared tensor is decoded once and used by both nodes.
+    assert tensors[0] is tensors[1]
+    assert tensors[1] is not tensors[2]
+
+    assert (output.value == single.to(output.value.device)).all().item()
+
+
+@torch.no_grad()
+def test_serialize_dedup_unshared(gpt2: nnsight.LanguageModel, MSG_prompt: str):
+    single = torch.rand(gpt2.config.n_embd)
+
+    with gpt2.trace(MSG_prompt, validate=True, scan=True) as tracer:
+        gpt2.transformer.h[0].output[0][:] = single
+
+        _test_serialize_dedup(tracer, n_shared=0)
+
+        # Nothing is shared so the request is encoded the same as without de-duplication.
+        with GlobalTracingContext.exit_global_tracing_context():
+            model_key = tracer.remote_backend_get_model_key()
+
+            assert (
+                RequestModel.create(tracer, model_key, dedup_tensors=True).model_dump_json()
+                == RequestModel.create(tracer, model_key).model_dump_json()
+            )
+
+
 @torch.no_grad()
 def test_adhoc_module(gpt2: nnsight.LanguageModel):
     with gpt2.generate(validate=True) as generator:
@@ -0,0 +1,302 @@
+import errno
+import gzip
+import io
+import os
+import zlib
+from fractions import Fraction
+
+import pytest
+import torch
+from requests.structures import CaseInsensitiveDict
+
+from nnsight import CONFIG
+from nnsight.contexts.backends.RemoteBackend import _SIO_CLIENTS, RemoteBackend
+from nnsight.schema.Response import ResultModel
+
+
+class StubStream:
+    def __init__(self, body: bytes, status_code: int, headers: dict):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.raw = io.BytesIO(body)
+
+    def iter_content(self, chunk_size: int):
+        data = self.raw.read()
+
+        if self.headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class StubSession:
+    """Serves one result body the way the remote service would, recording the Range header of each request."""
+
+    def __init__(
+        self,
+        body: bytes,
+        format: str = "pt",
+        ranges: bool = False,
+        encoding: str = None,
+        missing: int = 0,
+    ):
+        self.body = body
+        self.format = format
+        self.ranges = ranges
+        self.encoding = encoding
+        self.missing = missing
+
+        self.requests = []
+
+    def get(self, url: str, headers: dict = None, stream: bool = False):
+        range = (headers or {}).get("Range")
+
+        self.requests.append(range)
+
+        response_headers = {"format": self.format}
+
+        if range is not None and self.ranges:
+            start, end = map(int, range[len("bytes=") :].split("-"))
+
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{len(self.body)}"
+
+            return StubStream(self.body[start : end + 1], 206, response_headers)
+
+        body = self.body
+
+        if self.encoding == "gzip":
+            body = gzip.compress(body)
+            response_headers["Content-Encoding"] = "gzip"
+
+        response_headers["Content-length"] = str(len(body))
+
+        return StubStream(body[: len(body) - self.missing], 200, response_headers)
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    # Small chunks so every download takes several reads.
+    monkeypatch.setattr(CONFIG.API, "DOWNLOAD_CHUNK", 64)
+
+    return RemoteBackend(host="localhost", api_key="test")
+
+
+def _pt_result(value):
+    data = io.BytesIO()
+
+    torch.save({"id": "job", "value": value}, data)
+
+    return data.getvalue()
+
+
+@pytest.fixture
+def result_value():
+    return {
+        "saves": {
+            "hidden": torch.rand((2, 3)),
+            "ids": torch.arange(4),
+            "mask": torch.tensor([True, False]),
+            "empty": torch.empty((0, 3)),
+        },
+        # Session graphs that saved nothing.
+        0: {},
+        1: {"logits": torch.rand((1, 5), dtype=torch.float16), "nested": {}},
+    }
+
+
+def _assert_equal(value, expected):
+    if isinstance(expected, dict):
+        assert isinstance(value, dict)
+        assert value.keys() == expected.keys()
+
+        for key in expected:
+            _assert_equal(value[key], expected[key])
+    else:
+        assert value.dtype == expected.dtype
+        assert torch.equal(value, expected)
+
+
+def test_safetensors(result_value):
+    data = ResultModel.to_safetensors(result_value)
+
+    assert data is not None
+
+    _assert_equal(ResultModel.from_safetensors(memoryview(bytearray(data))), result_value)
+
+
+def test_safetensors_file(result_value, tmp_path):
+    path = tmp_path / "result.safetensors"
+    path.write_bytes(ResultModel.to_safetensors(result_value))
+
+    _assert_equal(ResultModel.from_safetensors_file(str(path)), result_value)
+
+
+def test_safetensors_non_tensor():
+    assert ResultModel.to_safetensors({"saves": {"value": 1}}) is None
+
+
+def test_safetensors_shared_storage():
+    hidden = torch.rand((2, 3))
+
+    # A save and a slice of it, or the same value saved twice, fall back to pickle.
+    assert ResultModel.to_safetensors({"hidden": hidden, "first": hidden[0]}) is None
+    assert ResultModel.to_safetensors({0: {"hidden": hidden}, 1: {"hidden": hidden}}) is None
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_get_result(backend, monkeypatch, result_value, mmap):
+    monkeypatch.setattr(CONFIG.API, "MMAP_RESULTS", mmap)
+
+    backend._session = StubSession(_pt_result(result_value))
+
+    _assert_equal(backend.get_result("job").value, result_value)
+
+    assert backend._session.requests == [None]
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_get_result_safetensors(backend, monkeypatch, result_value, mmap):
+    monkeypatch.setattr(CONFIG.API, "MMAP_RESULTS", mmap)
+
+    backend._session = StubSession(
+        ResultModel.to_safetensors(result_value), format="safetensors"
+    )
+
+    _assert_equal(backend.get_result("job").value, result_value)
+
+
+def test_get_result_ranges(backend, monkeypatch, result_value):
+    monkeypatch.setattr(CONFIG.API, "PARALLEL_DOWNLOADS", 4)
+
+    backend._session = StubSession(_pt_result(result_value), ranges=True)
+
+    _assert_equal(backend.get_result("job").value, result_value)
+
+    # Probed with a single byte and never requested the whole body.
+    assert backend._session.requests[0] == "bytes=0-0"
+    assert len(backend._session.requests) == 5
+    assert None not in backend._session.requests
+
+
+def test_get_result_ranges_unsupported(backend, monkeypatch, result_value):
+    monkeypatch.setattr(CONFIG.API, "PARALLEL_DOWNLOADS", 4)
+
+    # Server answers the probe with 200 and the whole body.
+    backend._session = StubSession(_pt_result(result_value), ranges=False)
+
+    _assert_equal(backend.get_result("job").value, result_value)
+
+    assert backend._session.requests == ["bytes=0-0", None]
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_get_result_short(backend, monkeypatch, result_value, mmap):
+    monkeypatch.setattr(CONFIG.API, "MMAP_RESULTS", mmap)
+
+    backend._session = StubSession(_pt_result(result_value), missing=10)
+
+    with pytest.raises(Exception, match="Result download ended"):
+        backend.get_result("job")
+
+
+def test_get_result_mmap_no_space(backend, monkeypatch, result_value):
+    monkeypatch.setattr(CONFIG.API, "MMAP_RESULTS", True)
+
+    def posix_fallocate(fd, offset, length):
+        raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+
+    monkeypatch.setattr(os, "posix_fallocate", posix_fallocate, raising=False)
+
+    backend._session = StubSession(_pt_result(result_value))
+
+    _assert_equal(backend.get_result("job").value, result_value)
+
+
+def test_get_result_encoded(backend, result_value):
+    backend._session = StubSession(_pt_result(result_value), encoding="gzip")
+
+    _assert_equal(backend.get_result("job").value, result_value)
+
+
+def test_get_result_mmap_pickle(backend, monkeypatch):
+    monkeypatch.setattr(CONFIG.API, "MMAP_RESULTS", True)
+
+    # Not loadable with weights_only=True, so it's loaded again with the full unpickler.
+    value = {"hidden": torch.rand((2, 3)), "ratio": Fraction(1, 3)}
+
+    backend._session = StubSession(_pt_result(value))
+
+    result = backend.get_result("job").value
+
+    assert torch.equal(result["hidden"], value["hidden"])
+    assert result["ratio"] == value["ratio"]
+
+
+class StubRequest:
+    tensors = None
+
+    def model_dump_json(self, exclude=None):
+        return '{"model_key": "test"}'
+
+
+def test_serialize(backend, monkeypatch):
+    data, headers = backend.serialize(StubRequest())
+
+    assert data == b'{"model_key": "test"}'
+    assert headers["Content-Type"] == "application/json"
+    assert "compression" not in headers
+
+    monkeypatch.setattr(CONFIG.API, "COMPRESSION", "zlib")
+
+    data, headers = backend.serialize(StubRequest())
+
+    assert zlib.decompress(data) == b'{"model_key": "test"}'
+    assert headers["Content-Type"] == "application/octet-stream"
+    assert headers["compression"] == "zlib"
+    assert "dedup" not in headers
+
+    request = StubRequest()
+    request.tensors = {0: None}
+
+    _, headers = backend.serialize(request)
+
+    assert headers["dedup"] == "1"
+
+
+class StubClient:
+    connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+
+def test_websocket_reuse(backend, monkeypatch):
+    client = StubClient()
+
+    monkeypatch.setitem(_SIO_CLIENTS, backend.ws_address, [client])
+
+    with backend._websocket() as sio_future:
+        assert sio_future.result() is client
+
+    # Handed back for the next request.
+    assert _SIO_CLIENTS[backend.ws_address] == [client]
+
+    with pytest.raises(KeyboardInterrupt):
+        with backend._websocket() as sio_future:
+            assert sio_future.result() is client
+
+            raise KeyboardInterrupt()
+
+    # Dropped after a failed request.
+    assert _SIO_CLIENTS[backend.ws_address] == []
+    assert not client.connected